@@ -0,0 +1,78 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+# The app reads its settings at import time, so point it at a throwaway
+# database and folders before importing it
+_workdir = tempfile.mkdtemp(prefix='platform-tests-')
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(_workdir, 'platform.db')
+os.environ['DASHBOARD_CACHE'] = 'none'
+os.environ['OFFICE_CONVERTER'] = 'fake'
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as platform  # noqa: E402
+
+
+@pytest.fixture(scope='session')
+def flask_app():
+    platform.app.config.update(
+        TESTING=True,
+        UPLOADS_FOLDER=os.path.join(_workdir, 'uploads'),
+        COURSES_FOLDER=os.path.join(_workdir, 'courses'),
+    )
+    os.makedirs(platform.app.config['UPLOADS_FOLDER'], exist_ok=True)
+    os.makedirs(platform.app.config['COURSES_FOLDER'], exist_ok=True)
+    platform.setup_database(platform.app)
+    return platform.app
+
+
+@pytest.fixture
+def app_context(flask_app):
+    with flask_app.app_context():
+        yield
+        platform.db.session.rollback()
+
+
+@pytest.fixture
+def admin_client(flask_app):
+    client = flask_app.test_client()
+    client.post('/login', data={'email': 'superadmin@app.com', 'password': 'superadmin123'})
+    return client
+
+
+@pytest.fixture
+def make_user(app_context):
+    """Creates a learner with a unique email, optionally reporting to superior_id."""
+    def make(superior_id=None):
+        role = platform.Role.query.filter_by(name='Learner').one()
+        user = platform.User(
+            name='Learner', email=f'learner-{os.urandom(4).hex()}@example.com',
+            password_hash='x', role_id=role.id, superior_id=superior_id
+        )
+        platform.db.session.add(user)
+        platform.db.session.commit()
+        return user
+    return make
+
+
+@pytest.fixture
+def make_course(app_context):
+    def make():
+        admin = platform.User.query.filter_by(email='superadmin@app.com').one()
+        course = platform.Course(
+            name='Course', original_filename='course.pptx',
+            folder_name=f'course_{os.urandom(4).hex()}', user_id=admin.id
+        )
+        platform.db.session.add(course)
+        platform.db.session.commit()
+        return course
+    return make
+
+
+def stat_counts(scope, scope_id):
+    """{status: count} of the stored enrollment counters for one user or course."""
+    return {status: count for status, count in platform.db.session.query(
+        platform.EnrollmentStat.status, platform.EnrollmentStat.count
+    ).filter_by(scope=scope, scope_id=scope_id) if count}
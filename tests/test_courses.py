@@ -0,0 +1,21 @@
+import io
+
+from conftest import platform
+
+
+def _upload(client, data, filename):
+    return client.post('/manage_courses', data={'file': (io.BytesIO(data), filename)},
+                       content_type='multipart/form-data', follow_redirects=True)
+
+
+def test_reusing_a_deck_still_converting_says_so(admin_client, app_context, monkeypatch):
+    monkeypatch.setattr(platform, 'schedule_conversion_job', lambda job_id: None)  # keep the job queued
+    deck = b'PK' + b'still converting' * 100
+
+    _upload(admin_client, deck, 'first.pptx')
+    response = _upload(admin_client, deck, 'second.pptx')
+
+    assert b'already being converted' in response.data
+    assert b'its slides are ready' not in response.data
+    assert platform.SlideSet.query.filter_by(folder_name=platform.Course.query.filter_by(
+        original_filename='second.pptx').one().folder_name).one().ref_count == 2
@@ -0,0 +1,68 @@
+import threading
+
+from conftest import platform, stat_counts
+
+
+def test_concurrent_flushes_count_a_status_change_once(app_context, make_user, make_course, monkeypatch):
+    user, course = make_user(), make_course()
+    platform.bulk_enroll(course.id, [user.id], user.id)
+    platform.db.session.commit()
+    enrollment_id = platform.Enrollment.query.filter_by(user_id=user.id).one().id
+
+    # Two processes' buffers holding the same report, flushed at the same time:
+    # both read the enrollment before either of them writes it
+    buffers = [platform.ProgressBuffer(), platform.ProgressBuffer()]
+    for buffer in buffers:
+        buffer.pending[enrollment_id] = {
+            'last_slide': 3, 'status': 'In Progress', 'last_accessed': platform.datetime.utcnow(),
+            'completion_date': None
+        }
+    both_read = threading.Barrier(2, timeout=10)
+    execute = platform.db.session.execute
+
+    def execute_after_both_read(statement, *args, **kwargs):
+        if getattr(statement, 'is_update', False) and statement.table.name == 'enrollment':
+            try:
+                both_read.wait()
+            except threading.BrokenBarrierError:
+                pass
+        return execute(statement, *args, **kwargs)
+
+    monkeypatch.setattr(platform.db.session, 'execute', execute_after_both_read)
+    threads = [threading.Thread(target=buffer.flush) for buffer in buffers]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    monkeypatch.undo()
+    # The report that lost the race was put back; retrying it changes nothing
+    for buffer in buffers:
+        assert buffer.flush() is not None
+        assert not buffer.pending
+
+    platform.db.session.expire_all()
+    enrollment = platform.db.session.get(platform.Enrollment, enrollment_id)
+    assert (enrollment.status, enrollment.last_slide) == ('In Progress', 3)
+    assert stat_counts('user', user.id) == {'In Progress': 1}
+    assert stat_counts('course', course.id) == {'In Progress': 1}
+
+
+def test_progress_api_rejects_slides_outside_the_course(flask_app, make_user, make_course):
+    learner, course = make_user(), make_course()
+    learner.password_hash = platform.bcrypt.generate_password_hash('secret', 4).decode()
+    platform.bulk_enroll(course.id, [learner.id], learner.id)
+    entries = [{'number': n, 'file': f'slide_{n}.png', 'width': 1, 'height': 1, 'bytes': 1, 'hash': 'x'} for n in (1, 2, 3)]
+    platform.save_slide_manifest(course.folder_name, entries)
+    platform.db.session.commit()
+    client = flask_app.test_client()
+    client.post('/login', data={'email': learner.email, 'password': 'secret'})
+
+    def report(event, slide):
+        return client.post('/api/progress', json={'course_id': course.id, 'event': event, 'slide': slide}).status_code
+
+    assert report('slide', True) == 400
+    assert report('slide', 0) == 400
+    assert report('slide', 10 ** 9) == 400
+    assert report('started', 4) == 400
+    assert report('completed', 2) == 400
+    assert report('slide', 3) == 202
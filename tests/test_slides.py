@@ -0,0 +1,79 @@
+import os
+import struct
+
+from conftest import platform
+
+
+def _write_slides(folder_name, count):
+    folder = os.path.join(platform.app.config['COURSES_FOLDER'], folder_name)
+    os.makedirs(folder, exist_ok=True)
+    png = b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR' + struct.pack('>II', 64, 48) + b'\x08\x02\x00\x00\x00'
+    for number in range(1, count + 1):
+        with open(os.path.join(folder, f'slide_{number}.png'), 'wb') as f:
+            f.write(png)
+
+
+def test_manifest_is_not_built_while_the_folder_is_converting(app_context, make_course):
+    course = make_course()
+    _write_slides(course.folder_name, 2)  # the first slides of a longer deck
+    job = platform.ConversionJob(folder_name=course.folder_name, source_path='deck.pptx', status='running')
+    platform.db.session.add(job)
+    platform.db.session.commit()
+
+    assert platform.get_slide_manifest(course.folder_name) is None
+    assert platform.db.session.get(platform.SlideManifest, course.folder_name) is None
+
+    job.status = 'failed'
+    platform.db.session.commit()
+    assert platform.get_slide_manifest(course.folder_name) is None
+
+
+def test_manifest_is_built_for_folders_without_a_job(app_context, make_course):
+    course = make_course()
+    _write_slides(course.folder_name, 3)
+
+    manifest = platform.get_slide_manifest(course.folder_name)
+
+    assert manifest.slide_count == 3
+    assert platform.db.session.get(platform.SlideManifest, course.folder_name) is not None
+
+
+def test_conversion_uses_the_module_level_converter(app_context, make_course, monkeypatch):
+    converted = []
+
+    class RecordingConverter(platform.FakeOfficeConverter):
+        def to_pdf(self, source_path, output_folder):
+            converted.append(source_path)
+            return super().to_pdf(source_path, output_folder)
+
+    monkeypatch.setattr(platform, '_office_converter', RecordingConverter())
+    monkeypatch.setitem(platform.app.config, 'FAKE_CONVERTER_PAGES', 1)
+    monkeypatch.setitem(platform.app.config, 'PROCESS_POOL_WORKERS', 1)
+    course = make_course()
+    folder = os.path.join(platform.app.config['COURSES_FOLDER'], course.folder_name)
+    os.makedirs(folder, exist_ok=True)
+    source_path = os.path.join(platform.app.config['UPLOADS_FOLDER'], f'{course.folder_name}.pptx')
+    with open(source_path, 'wb') as f:
+        f.write(b'PK')
+    job = platform.ConversionJob(folder_name=course.folder_name, source_path=source_path)
+    platform.db.session.add(job)
+    platform.db.session.commit()
+
+    platform.run_conversion_job(job.id)
+
+    platform.db.session.expire_all()
+    assert platform.db.session.get(platform.ConversionJob, job.id).status == 'done'
+    assert converted == [source_path]
+    assert platform.get_slide_manifest(course.folder_name).slide_count == 1
+
+
+def test_office_converter_is_abstract():
+    class Incomplete(platform.OfficeConverter):
+        pass
+
+    try:
+        Incomplete()
+    except TypeError:
+        pass
+    else:
+        raise AssertionError('OfficeConverter subclasses must implement to_pdf')
@@ -0,0 +1,31 @@
+from conftest import platform, stat_counts
+
+
+def test_delete_user_with_enrollments(admin_client, make_user, make_course):
+    manager = make_user()
+    learner = make_user(superior_id=manager.id)
+    courses = [make_course(), make_course()]
+    for course in courses:
+        platform.bulk_enroll(course.id, [manager.id, learner.id], manager.id)
+    platform.db.session.commit()
+    manager_id, learner_id = manager.id, learner.id
+    manager_enrollments = [e.id for e in platform.Enrollment.query.filter_by(user_id=manager_id)]
+    # An overdue reminder is pending and progress is waiting to be flushed
+    platform.queue_overdue_reminders(platform.datetime.utcnow(), platform.Enrollment.id == manager_enrollments[0])
+    platform.db.session.commit()
+    platform.progress_buffer.record(manager_enrollments[1], 'In Progress', 2)
+
+    response = admin_client.post(f'/user/delete/{manager_id}')
+
+    assert response.status_code == 302
+    platform.db.session.expire_all()
+    assert platform.db.session.get(platform.User, manager_id) is None
+    assert platform.Enrollment.query.filter_by(user_id=manager_id).count() == 0
+    assert platform.Enrollment.query.filter_by(assigned_by_id=manager_id).count() == 0
+    assert platform.db.session.get(platform.User, learner_id).superior_id is None
+    assert stat_counts('user', manager_id) == {}
+    for course in courses:
+        assert stat_counts('course', course.id) == {'Not Started': 1}
+    assert stat_counts('user', learner_id) == {'Not Started': 2}
+    assert platform.Reminder.query.filter_by(user_id=manager_id).count() == 0
+    assert platform.progress_buffer.pending_for(manager_enrollments[1]) is None